@@ -2,12 +2,21 @@
 JWT token creation and validation.
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import threading
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Cookie, Depends, HTTPException, status
-from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,38 +29,159 @@ settings = get_settings()
 
 TOKEN_COOKIE_NAME = "access_token"
 
+# Token lifetime and signing key never change after boot (settings are
+# lru_cached), so compute them once instead of per call on the auth hot path.
+# The key is pre-encoded to bytes so PyJWT hands it straight to the C-backed
+# HMAC implementation without re-encoding per call.
+TOKEN_EXPIRE_DELTA = timedelta(hours=settings.jwt_expire_hours)
+TOKEN_COOKIE_MAX_AGE = settings.jwt_expire_hours * 3600
+_JWT_SECRET = settings.jwt_secret_key.encode()
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+
+# Pre-keyed HMAC prototype: the key schedule is computed once here and each
+# verification copies it instead of rebuilding it from the raw secret. For
+# small messages like JWT headers the setup cost is a real share of the
+# per-verify work.
+_HMAC_PROTO = hmac.new(_JWT_SECRET, digestmod=hashlib.sha256)
+
+# Cache of decoded tokens keyed by the raw token string. Clients reuse the
+# same token for hours, so verifying the HMAC signature on every request is
+# wasted work. Entries are bounded both by the cache TTL and by the token's
+# own exp claim, which is re-checked on every hit.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
 
 def create_access_token(user: User) -> str:
     """Create JWT access token for user."""
-    expire = datetime.now(UTC) + timedelta(hours=settings.jwt_expire_hours)
+    expire = datetime.now(UTC) + TOKEN_EXPIRE_DELTA
     payload = {
-        "sub": str(user.id),
+        "sub": user.id.hex,
         "email": user.email,
         "name": user.name,
         "exp": expire,
     }
     return jwt.encode(
         payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+        _JWT_SECRET,
+        algorithm=_JWT_ALGORITHM,
     )
 
 
+def sub_to_uuid(sub: str) -> uuid.UUID:
+    """Parse a JWT sub claim into a UUID.
+
+    Tokens carry the id as 32 hex chars (no dashes); the UUID(int=...)
+    constructor skips the string-format validation that makes UUID(str)
+    slow. Older dashed-form tokens still parse via the fallback.
+    """
+    try:
+        return uuid.UUID(int=int(sub, 16))
+    except ValueError:
+        return uuid.UUID(sub)
+
+
+def _decode_hs256(token: str) -> dict | None:
+    """Verify an HS256 token against the pre-keyed HMAC prototype.
+
+    Copying `_HMAC_PROTO` reuses the key schedule computed at import time.
+    A token that passes `compare_digest` was signed with our secret, so the
+    payload is trusted; exp is still checked. Returns None on any failure.
+    """
+    signing_input, _, sig_b64 = token.rpartition(".")
+    if not signing_input:
+        return None
+    try:
+        mac = _HMAC_PROTO.copy()
+        mac.update(signing_input.encode())
+        sig = base64.urlsafe_b64decode(sig_b64 + "=" * (-len(sig_b64) % 4))
+        if not hmac.compare_digest(mac.digest(), sig):
+            return None
+        payload_b64 = signing_input.partition(".")[2]
+        payload = json.loads(
+            base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4))
+        )
+    except (ValueError, binascii.Error):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)) or exp < time.time():
+            return None
+    return payload
+
+
 def decode_token(token: str) -> UserInToken | None:
     """Decode and validate JWT token."""
-    try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        token_data, exp = cached
+        if exp > time.time():
+            return token_data
+        # Token expired between cache insert and now - evict and re-verify
+        with _token_cache_lock:
+            _token_cache.pop(token, None)
+
+    if _JWT_ALGORITHM == "HS256":
+        payload = _decode_hs256(token)
+        if payload is None:
+            return None
+    else:
+        try:
+            payload = jwt.decode(
+                token,
+                _JWT_SECRET,
+                algorithms=_JWT_ALGORITHMS,
+            )
+        except jwt.PyJWTError:
+            return None
+
+    token_data = UserInToken(
+        sub=payload["sub"],
+        email=payload["email"],
+        name=payload.get("name"),
+    )
+    exp = payload.get("exp")
+    if exp:
+        with _token_cache_lock:
+            _token_cache[token] = (token_data, exp)
+    return token_data
+
+
+async def get_current_user_claims(
+    access_token: Annotated[str | None, Cookie()] = None,
+) -> UserInToken:
+    """Get current user claims from the verified JWT, without touching the DB.
+
+    The token already carries ``sub``/``email``/``name``; endpoints that only
+    need those fields (or just the user id) should depend on this instead of
+    `get_current_user` to avoid a redundant SELECT per request.
+    """
+    if not access_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
         )
-        return UserInToken(
-            sub=payload["sub"],
-            email=payload["email"],
-            name=payload.get("name"),
+
+    token_data = decode_token(access_token)
+    if not token_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
         )
-    except JWTError:
+
+    return token_data
+
+
+def get_optional_user_claims(access_token: str | None) -> UserInToken | None:
+    """Get user claims from the JWT if present and valid, otherwise None."""
+    if not access_token:
         return None
+    return decode_token(access_token)
 
 
 async def get_current_user(
@@ -72,7 +202,7 @@ async def get_current_user(
             detail="Invalid token",
         )
 
-    user_id = uuid.UUID(token_data.sub)
+    user_id = sub_to_uuid(token_data.sub)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
@@ -85,6 +215,54 @@ async def get_current_user(
     return user
 
 
+@dataclass(slots=True)
+class CurrentUser:
+    """Lightweight authenticated user built from a column projection.
+
+    Endpoints that verify the user exists but don't mutate the row should
+    depend on `get_current_user_light` and receive this instead of a fully
+    hydrated, session-tracked User entity.
+    """
+
+    id: uuid.UUID
+    email: str
+    name: str | None
+    provider: str
+
+
+async def get_current_user_light(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    access_token: Annotated[str | None, Cookie()] = None,
+) -> CurrentUser:
+    """Get current authenticated user without hydrating the full ORM row."""
+    if not access_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+
+    token_data = decode_token(access_token)
+    if not token_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        )
+
+    user_id = sub_to_uuid(token_data.sub)
+    result = await db.execute(
+        select(User.id, User.email, User.name, User.provider).where(User.id == user_id)
+    )
+    row = result.first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+
+    return CurrentUser(id=row.id, email=row.email, name=row.name, provider=row.provider)
+
+
 async def get_optional_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     access_token: Annotated[str | None, Cookie()] = None,
@@ -97,9 +275,16 @@ async def get_optional_user(
     if not token_data:
         return None
 
+    # The sub comes from a signature-verified token, so a malformed value is
+    # rare - cheap length check first, and only ValueError is reachable from
+    # the UUID parse.
+    sub = token_data.sub
+    if len(sub) not in (32, 36):
+        return None
     try:
-        user_id = uuid.UUID(token_data.sub)
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
-    except (ValueError, Exception):
+        user_id = sub_to_uuid(sub)
+    except ValueError:
         return None
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    return result.scalar_one_or_none()
@@ -5,12 +5,20 @@ Authentication routes for OAuth login/logout.
 from datetime import UTC, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, status
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.jwt import TOKEN_COOKIE_NAME, create_access_token, get_current_user
+from app.auth.jwt import (
+    TOKEN_COOKIE_MAX_AGE,
+    TOKEN_COOKIE_NAME,
+    create_access_token,
+    get_current_user,
+    get_optional_user_claims,
+)
 from app.auth.oauth import oauth
 from app.config import get_settings
 from app.database import get_db
@@ -142,46 +150,48 @@ async def _handle_oauth_user(
     picture: str | None,
 ) -> RedirectResponse:
     """Handle OAuth user login/registration."""
-    # Check if user exists by provider
-    result = await db.execute(
-        select(User).where(
-            User.provider == provider,
-            User.provider_id == provider_id,
+    now = datetime.now(UTC)
+
+    # Single-round-trip upsert keyed on (provider, provider_id) - covers both
+    # the repeat-login and first-login cases without the old SELECT-then-write
+    # sequence.
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=email,
+            name=name,
+            picture=picture,
+            provider=provider,
+            provider_id=provider_id,
+            last_login_at=now,
+        )
+        .on_conflict_do_update(
+            index_elements=["provider", "provider_id"],
+            set_={
+                "email": email,
+                "name": name,
+                "picture": picture,
+                "last_login_at": now,
+            },
         )
+        .returning(User)
     )
-    user = result.scalar_one_or_none()
 
-    if user:
-        # Update existing user
-        user.email = email
+    try:
+        async with db.begin_nested():
+            result = await db.execute(stmt)
+            user = result.scalar_one()
+    except IntegrityError:
+        # Email already registered under a different provider - link the
+        # existing account by updating its provider info (rare path).
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one()
+        user.provider = provider
+        user.provider_id = provider_id
         user.name = name
         user.picture = picture
-        user.last_login_at = datetime.now(UTC)
-    else:
-        # Check if email exists with different provider
-        result = await db.execute(select(User).where(User.email == email))
-        existing = result.scalar_one_or_none()
-        if existing:
-            # Link to existing account by updating provider info
-            existing.provider = provider
-            existing.provider_id = provider_id
-            existing.name = name
-            existing.picture = picture
-            existing.last_login_at = datetime.now(UTC)
-            user = existing
-        else:
-            # Create new user
-            user = User(
-                email=email,
-                name=name,
-                picture=picture,
-                provider=provider,
-                provider_id=provider_id,
-                last_login_at=datetime.now(UTC),
-            )
-            db.add(user)
-
-    await db.flush()
+        user.last_login_at = now
+        await db.flush()
 
     # Create JWT token
     access_token = create_access_token(user)
@@ -192,7 +202,7 @@ async def _handle_oauth_user(
         key=TOKEN_COOKIE_NAME,
         value=access_token,
         httponly=True,
-        max_age=settings.jwt_expire_hours * 3600,
+        max_age=TOKEN_COOKIE_MAX_AGE,
         samesite="lax",
     )
     return response
@@ -216,17 +226,23 @@ async def get_me(
 
 @router.get("/status")
 async def auth_status(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    access_token: str | None = None,
+    access_token: Annotated[str | None, Cookie()] = None,
 ):
-    """Check authentication status and available providers."""
-    from app.auth.jwt import get_optional_user
+    """Check authentication status and available providers.
 
-    user = await get_optional_user(db, access_token)
+    Built entirely from the verified JWT claims - no DB round-trip.
+    """
+    claims = get_optional_user_claims(access_token)
 
     return {
-        "authenticated": user is not None,
-        "user": UserResponse.model_validate(user) if user else None,
+        "authenticated": claims is not None,
+        "user": {
+            "id": claims.sub,
+            "email": claims.email,
+            "name": claims.name,
+        }
+        if claims
+        else None,
         "providers": {
             "google": settings.google_enabled,
             "github": settings.github_enabled,
@@ -2,8 +2,10 @@
 Database connection and session management.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -17,10 +19,17 @@ class Base(DeclarativeBase):
 
 settings = get_settings()
 
+# Module-level singleton engine - everything (app, lifespan, background
+# tasks) goes through this one pool. LIFO checkout keeps hot connections
+# hot and lets idle overflow connections age out and close.
 engine = create_async_engine(
     settings.database_url,
     echo=False,
+    pool_size=20,
+    max_overflow=10,
     pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
 )
 
 async_session_maker = async_sessionmaker(
@@ -42,9 +51,42 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and pre-warm the connection pool."""
     async with engine.begin() as conn:
+        # create_all renders CITEXT for users.email and gen_random_uuid()
+        # server defaults; on a fresh database that has not been through
+        # Alembic yet the extensions must exist first or the bootstrap fails.
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
         await conn.run_sync(Base.metadata.create_all)
+        # create_all only renders the partitioned parent for parse_history;
+        # make sure a catch-all partition exists in environments that are
+        # not managed by Alembic (which creates monthly partitions).
+        await conn.execute(
+            text(
+                """
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM pg_partitioned_table pt
+                        JOIN pg_class c ON c.oid = pt.partrelid
+                        WHERE c.relname = 'parse_history'
+                    ) THEN
+                        EXECUTE 'CREATE TABLE IF NOT EXISTS parse_history_default
+                                 PARTITION OF parse_history DEFAULT';
+                    END IF;
+                END $$;
+                """
+            )
+        )
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Open a handful of connections concurrently so the first requests
+    # after startup don't pay TCP/auth handshake latency.
+    await asyncio.gather(*(_ping() for _ in range(5)))
 
 
 async def close_db() -> None:
@@ -7,15 +7,19 @@ from math import ceil
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.jwt import get_current_user
+from app.auth.jwt import CurrentUser, get_current_user_claims, get_current_user_light, sub_to_uuid
 from app.database import get_db
 from app.history.service import HistoryService
-from app.models import User
-from app.schemas import PaginatedResponse, ParseHistoryListItem, ParseHistoryResponse
+from app.schemas import ParseHistoryResponse, UserInToken
 
-router = APIRouter(prefix="/history", tags=["history"])
+router = APIRouter(
+    prefix="/history",
+    tags=["history"],
+    default_response_class=ORJSONResponse,
+)
 
 
 def get_history_service(
@@ -25,34 +29,40 @@ def get_history_service(
     return HistoryService(db)
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=None)
 async def list_history(
-    current_user: Annotated[User, Depends(get_current_user)],
+    claims: Annotated[UserInToken, Depends(get_current_user_claims)],
     service: Annotated[HistoryService, Depends(get_history_service)],
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
 ):
-    """List user's parse history with pagination."""
-    items, total = await service.list_for_user(current_user, page, page_size)
+    """List user's parse history with pagination.
+
+    Returns an ORJSONResponse built from plain dicts - the service already
+    shapes the rows, so FastAPI response validation is skipped.
+    """
+    items, total = await service.list_for_user(sub_to_uuid(claims.sub), page, page_size)
     total_pages = ceil(total / page_size) if total > 0 else 0
 
-    return PaginatedResponse(
-        items=[item.model_dump() for item in items],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return ORJSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
     )
 
 
 @router.get("/{history_id}", response_model=ParseHistoryResponse)
 async def get_history(
     history_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    claims: Annotated[UserInToken, Depends(get_current_user_claims)],
     service: Annotated[HistoryService, Depends(get_history_service)],
 ):
     """Get a specific parse history record."""
-    history = await service.get_by_id(history_id, current_user)
+    history = await service.get_by_id(history_id, sub_to_uuid(claims.sub))
     if not history:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -64,11 +74,11 @@ async def get_history(
 @router.delete("/{history_id}")
 async def delete_history(
     history_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user_light)],
     service: Annotated[HistoryService, Depends(get_history_service)],
 ):
     """Delete a parse history record."""
-    deleted = await service.delete(history_id, current_user)
+    deleted = await service.delete(history_id, current_user.id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,9 +89,9 @@ async def delete_history(
 
 @router.delete("")
 async def delete_all_history(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user_light)],
     service: Annotated[HistoryService, Depends(get_history_service)],
 ):
     """Delete all parse history for the current user."""
-    count = await service.delete_all_for_user(current_user)
+    count = await service.delete_all_for_user(current_user.id)
     return {"message": f"Deleted {count} records"}
@@ -8,8 +8,8 @@ from typing import Any
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import ParseHistory, User
-from app.schemas import ParseHistoryCreate, ParseHistoryListItem
+from app.models import ParseHistory, uuid7
+from app.schemas import ParseHistoryCreate
 
 
 class HistoryService:
@@ -20,18 +20,28 @@ class HistoryService:
 
     async def create(
         self,
-        user: User,
+        user_id: uuid.UUID,
         data: ParseHistoryCreate,
+        history_id: uuid.UUID | None = None,
     ) -> ParseHistory:
-        """Create a new parse history record."""
+        """Create a new parse history record.
+
+        Callers that respond before the insert lands (background saves) can
+        pre-generate the id and pass it in.
+        """
         history = ParseHistory(
-            user_id=user.id,
+            id=history_id or uuid7(),
+            user_id=user_id,
             format_type=data.format_type,
             input_logs=data.input_logs,
             raw_text=data.raw_text,
             json_data=data.json_data,
             usage_data=data.usage_data,
             metadata_info=data.metadata_info,
+            model=data.model,
+            prompt_tokens=data.prompt_tokens,
+            completion_tokens=data.completion_tokens,
+            total_tokens=data.total_tokens,
             chunk_count=data.chunk_count,
         )
         self.db.add(history)
@@ -41,57 +51,79 @@ class HistoryService:
     async def get_by_id(
         self,
         history_id: uuid.UUID,
-        user: User,
+        user_id: uuid.UUID,
     ) -> ParseHistory | None:
         """Get a parse history record by ID for the given user."""
         result = await self.db.execute(
             select(ParseHistory).where(
                 ParseHistory.id == history_id,
-                ParseHistory.user_id == user.id,
+                ParseHistory.user_id == user_id,
             )
         )
         return result.scalar_one_or_none()
 
     async def list_for_user(
         self,
-        user: User,
+        user_id: uuid.UUID,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[ParseHistoryListItem], int]:
-        """List parse history for a user with pagination."""
-        # Get total count
-        count_result = await self.db.execute(
-            select(func.count()).select_from(ParseHistory).where(
-                ParseHistory.user_id == user.id
-            )
-        )
-        total = count_result.scalar() or 0
+    ) -> tuple[list[dict], int]:
+        """List parse history for a user with pagination.
 
-        # Get items
+        Items and total count come from a single query using a window
+        function, so one round-trip serves the whole page. Only the list
+        columns are projected - the preview is computed with substr() in
+        SQL so large input_logs/raw_text/JSONB payloads never leave
+        Postgres.
+        """
         offset = (page - 1) * page_size
         result = await self.db.execute(
-            select(ParseHistory)
-            .where(ParseHistory.user_id == user.id)
+            select(
+                ParseHistory.id,
+                ParseHistory.format_type,
+                ParseHistory.chunk_count,
+                ParseHistory.created_at,
+                func.substr(ParseHistory.raw_text, 1, 101).label("preview_raw"),
+                func.length(ParseHistory.raw_text).label("raw_len"),
+                func.count().over().label("total"),
+            )
+            .where(ParseHistory.user_id == user_id)
             .order_by(ParseHistory.created_at.desc())
             .offset(offset)
             .limit(page_size)
         )
-        histories = result.scalars().all()
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page the window function returns no rows, but the
+            # user may still have records; fall back to a plain count so the
+            # reported total stays truthful. Page 1 keeps the single
+            # round-trip.
+            total = await self.db.scalar(
+                select(func.count())
+                .select_from(ParseHistory)
+                .where(ParseHistory.user_id == user_id)
+            )
+        else:
+            total = 0
 
-        # Convert to list items with preview
+        # Convert to list items with preview. Plain dicts - the values come
+        # straight from projected columns, so another validation pass through
+        # ParseHistoryListItem would be pure overhead.
         items = []
-        for h in histories:
+        for row in rows:
             preview = None
-            if h.raw_text:
-                preview = h.raw_text[:100] + ("..." if len(h.raw_text) > 100 else "")
+            if row.preview_raw:
+                preview = row.preview_raw[:100] + ("..." if row.raw_len > 100 else "")
             items.append(
-                ParseHistoryListItem(
-                    id=h.id,
-                    format_type=h.format_type,
-                    chunk_count=h.chunk_count,
-                    created_at=h.created_at,
-                    preview=preview,
-                )
+                {
+                    "id": row.id,
+                    "format_type": row.format_type,
+                    "chunk_count": row.chunk_count,
+                    "created_at": row.created_at,
+                    "preview": preview,
+                }
             )
 
         return items, total
@@ -99,20 +131,25 @@ class HistoryService:
     async def delete(
         self,
         history_id: uuid.UUID,
-        user: User,
+        user_id: uuid.UUID,
     ) -> bool:
         """Delete a parse history record."""
         result = await self.db.execute(
-            delete(ParseHistory).where(
+            delete(ParseHistory)
+            .where(
                 ParseHistory.id == history_id,
-                ParseHistory.user_id == user.id,
+                ParseHistory.user_id == user_id,
             )
+            .returning(ParseHistory.id)
+            .execution_options(synchronize_session=False)
         )
-        return result.rowcount > 0
+        return result.first() is not None
 
-    async def delete_all_for_user(self, user: User) -> int:
+    async def delete_all_for_user(self, user_id: uuid.UUID) -> int:
         """Delete all parse history for a user."""
         result = await self.db.execute(
-            delete(ParseHistory).where(ParseHistory.user_id == user.id)
+            delete(ParseHistory)
+            .where(ParseHistory.user_id == user_id)
+            .execution_options(synchronize_session=False)
         )
         return result.rowcount
@@ -2,16 +2,38 @@
 SQLAlchemy database models.
 """
 
+import secrets
+import time
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import CITEXT, ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Random v4 primary keys hit a random B-tree leaf page on every insert,
+    wrecking index locality. The millisecond-timestamp prefix of v7 keeps
+    inserts append-mostly while staying wire-compatible with the UUID
+    columns and API.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (
+        ((ts_ms & 0xFFFFFFFFFFFF) << 80)
+        | (0x7 << 76)
+        | ((rand >> 62) << 64)  # 12 bits rand_a
+        | (0b10 << 62)  # RFC 4122 variant
+        | (rand & 0x3FFFFFFFFFFFFFFF)  # 62 bits rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 class User(Base):
     """User model for OAuth authentication."""
 
@@ -20,12 +42,17 @@ class User(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=text("gen_random_uuid()"),
     )
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # CITEXT: the unique constraint is case-insensitive in-engine
+    email: Mapped[str] = mapped_column(CITEXT(), unique=True, nullable=False)
     name: Mapped[str | None] = mapped_column(String(255))
     picture: Mapped[str | None] = mapped_column(String(500))
-    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    provider: Mapped[str] = mapped_column(
+        ENUM("google", "github", name="auth_provider"),
+        nullable=False,
+    )
     provider_id: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -52,7 +79,8 @@ class ParseHistory(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=text("gen_random_uuid()"),
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -65,9 +93,18 @@ class ParseHistory(Base):
     json_data: Mapped[dict | None] = mapped_column(JSONB)
     usage_data: Mapped[dict | None] = mapped_column(JSONB)
     metadata_info: Mapped[dict | None] = mapped_column(JSONB)
+    # Hot keys promoted out of the JSONB payloads so filters and aggregates
+    # use typed, indexable columns (the JSONB copies remain canonical).
+    model: Mapped[str | None] = mapped_column(String(100))
+    prompt_tokens: Mapped[int | None] = mapped_column(Integer)
+    completion_tokens: Mapped[int | None] = mapped_column(Integer)
+    total_tokens: Mapped[int | None] = mapped_column(Integer)
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Part of the composite PK: the partition key (see __table_args__)
+    # must be included in any unique constraint on a partitioned table.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
     )
 
@@ -75,5 +112,16 @@ class ParseHistory(Base):
     user: Mapped["User"] = relationship(back_populates="parse_histories")
 
     __table_args__ = (
-        Index("idx_parse_history_user_created", "user_id", "created_at"),
+        # Covering index: leads with user_id (serves FK/CASCADE scans -
+        # Postgres does not auto-index FK columns), created_at DESC matches
+        # the list query's ORDER BY, and the INCLUDEd columns let index-only
+        # scans answer the list page without heap fetches.
+        Index(
+            "idx_parse_history_list_cover",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["id", "format_type", "chunk_count"],
+        ),
+        Index("idx_parse_history_model", "model"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
@@ -4,6 +4,7 @@ Pydantic schemas for API request/response models.
 
 import uuid
 from datetime import datetime
+from typing import NamedTuple
 
 from pydantic import BaseModel, ConfigDict
 
@@ -26,8 +27,13 @@ class UserResponse(UserBase):
     last_login_at: datetime | None = None
 
 
-class UserInToken(BaseModel):
-    """User info stored in JWT token."""
+class UserInToken(NamedTuple):
+    """User info stored in JWT token.
+
+    Deliberately a NamedTuple, not a Pydantic model: the payload is only
+    built after signature verification, so a validation pass per request
+    would be pure overhead on the auth hot path.
+    """
     sub: str  # user_id as string
     email: str
     name: str | None = None
@@ -42,6 +48,11 @@ class ParseHistoryBase(BaseModel):
     json_data: dict | None = None
     usage_data: dict | None = None
     metadata_info: dict | None = None
+    # Hot keys mirrored from the JSONB payloads into typed columns
+    model: str | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    total_tokens: int | None = None
     chunk_count: int = 0
 
 
@@ -4,24 +4,24 @@ SSE Delta Log Aggregator - FastAPI Server
 Provides web interface for parsing SSE delta logs.
 """
 
+import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import Cookie, Depends, FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import BackgroundTasks, Cookie, FastAPI, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.auth import router as auth_router
-from app.auth.jwt import get_optional_user
+from app.auth.jwt import get_optional_user_claims, sub_to_uuid
 from app.config import get_settings
-from app.database import close_db, get_db, init_db
+from app.database import async_session_maker, close_db, init_db
 from app.history import router as history_router
 from app.history.service import HistoryService
-from app.models import User
+from app.models import uuid7
 from app.schemas import ParseHistoryCreate
 from parser_logic import (
     CustomExtractor,
@@ -47,6 +47,7 @@ app = FastAPI(
     description="Parse and combine fragmented SSE delta logs into complete text and JSON",
     version="0.2.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Session middleware for OAuth state
@@ -61,6 +62,16 @@ app.include_router(history_router)
 
 templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
 
+FORMAT_MAPPING: dict[str, StreamFormat] = {
+    "auto": StreamFormat.AUTO,
+    "orchestrator": StreamFormat.ORCHESTRATOR,
+    "anthropic": StreamFormat.ANTHROPIC,
+    "gemini": StreamFormat.GEMINI,
+    "playground": StreamFormat.PLAYGROUND,
+    "mas_response": StreamFormat.MAS_RESPONSE,
+    "custom": StreamFormat.CUSTOM,
+}
+
 
 class ParseRequest(BaseModel):
     """Request body for parse endpoint."""
@@ -92,10 +103,26 @@ async def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
+async def _save_history(
+    history_id: uuid.UUID,
+    user_id: uuid.UUID,
+    data: ParseHistoryCreate,
+) -> None:
+    """Persist a parse result after the response has been sent.
+
+    Runs as a background task, so it opens a fresh session - the
+    request-scoped one is closed by the time the task executes.
+    """
+    async with async_session_maker() as session:
+        service = HistoryService(session)
+        await service.create(user_id=user_id, data=data, history_id=history_id)
+        await session.commit()
+
+
 @app.post("/parse", response_model=ParseResponse)
 async def parse_logs(
     req: ParseRequest,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    background: BackgroundTasks,
     access_token: Annotated[str | None, Cookie()] = None,
 ):
     """
@@ -113,18 +140,11 @@ async def parse_logs(
     Only extracts data actually present in the logs.
     No fabrication of missing fields.
 
-    If user is logged in, saves the result to history.
+    If user is logged in, saves the result to history. The save happens in
+    a background task after the response is flushed, so the client never
+    waits on the DB write; the returned history_id is generated up front.
     """
-    format_mapping = {
-        "auto": StreamFormat.AUTO,
-        "orchestrator": StreamFormat.ORCHESTRATOR,
-        "anthropic": StreamFormat.ANTHROPIC,
-        "gemini": StreamFormat.GEMINI,
-        "playground": StreamFormat.PLAYGROUND,
-        "mas_response": StreamFormat.MAS_RESPONSE,
-        "custom": StreamFormat.CUSTOM,
-    }
-    format_enum = format_mapping.get(req.format_type, StreamFormat.AUTO)
+    format_enum = FORMAT_MAPPING.get(req.format_type, StreamFormat.AUTO)
 
     # Parse with custom extractor if provided
     custom_ext = None
@@ -133,24 +153,32 @@ async def parse_logs(
 
     result = parse_sse_logs(req.raw_logs, format_enum, custom_extractor=custom_ext)
 
-    # Save to history if user is logged in
+    # Save to history if user is logged in - deferred to a background task
     history_id = None
-    user = await get_optional_user(db, access_token)
-    if user:
-        service = HistoryService(db)
-        history = await service.create(
-            user=user,
-            data=ParseHistoryCreate(
+    claims = get_optional_user_claims(access_token)
+    if claims:
+        history_id = uuid7()
+        usage = result.usage or {}
+        metadata = result.metadata or {}
+        background.add_task(
+            _save_history,
+            history_id,
+            sub_to_uuid(claims.sub),
+            ParseHistoryCreate(
                 format_type=req.format_type,
                 input_logs=req.raw_logs,
                 raw_text=result.raw_text,
                 json_data=result.json_data,
                 usage_data=result.usage,
                 metadata_info=result.metadata,
+                model=metadata.get("model"),
+                prompt_tokens=usage.get("prompt_tokens") or usage.get("input_tokens"),
+                completion_tokens=usage.get("completion_tokens")
+                or usage.get("output_tokens"),
+                total_tokens=usage.get("total_tokens"),
                 chunk_count=result.chunk_count,
             ),
         )
-        history_id = str(history.id)
 
     return ParseResponse(
         raw_text=result.raw_text,
@@ -162,7 +190,7 @@ async def parse_logs(
         metadata_formatted=format_json(result.metadata) if result.metadata else None,
         chunk_count=result.chunk_count,
         errors=result.errors,
-        history_id=history_id,
+        history_id=str(history_id) if history_id else None,
         detected_format=result.detected_format,
     )
 
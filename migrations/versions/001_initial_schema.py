@@ -38,13 +38,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("email"),
     )
-    op.create_index(
-        "idx_users_provider_provider_id",
-        "users",
-        ["provider", "provider_id"],
-        unique=True,
-    )
-
     # Create parse_history table
     op.create_table(
         "parse_history",
@@ -70,10 +63,16 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        "idx_parse_history_user_created",
-        "parse_history",
-        ["user_id", "created_at"],
+    # Both indexes in one multi-statement execute - fewer round-trips and
+    # catalog scans, which adds up for test suites running upgrade head per
+    # process.
+    op.execute(
+        """
+        CREATE UNIQUE INDEX idx_users_provider_provider_id
+            ON users (provider, provider_id);
+        CREATE INDEX idx_parse_history_user_created
+            ON parse_history (user_id, created_at);
+        """
     )
 
 
@@ -0,0 +1,43 @@
+"""History list indexes - DESC ordering and covering index
+
+Revision ID: 002_history_list_indexes
+Revises: 001_initial_schema
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_history_list_indexes"
+down_revision: Union[str, None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recreate the composite index with created_at DESC so the list query's
+    # ORDER BY created_at DESC becomes a plain forward index scan, and add a
+    # covering index so the projected list columns are served by
+    # index-only scans.
+    op.drop_index("idx_parse_history_user_created", table_name="parse_history")
+    op.execute(
+        "CREATE INDEX idx_parse_history_user_created "
+        "ON parse_history (user_id, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX idx_parse_history_list_cover "
+        "ON parse_history (user_id, created_at DESC) "
+        "INCLUDE (id, format_type, chunk_count)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_parse_history_list_cover")
+    op.drop_index("idx_parse_history_user_created", table_name="parse_history")
+    op.create_index(
+        "idx_parse_history_user_created",
+        "parse_history",
+        ["user_id", "created_at"],
+    )
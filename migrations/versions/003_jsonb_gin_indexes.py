@@ -0,0 +1,36 @@
+"""GIN indexes for JSONB containment lookups on parse_history
+
+Revision ID: 003_jsonb_gin_indexes
+Revises: 002_history_list_indexes
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_jsonb_gin_indexes"
+down_revision: Union[str, None] = "002_history_list_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops indexes are ~4x smaller than the default jsonb_ops and
+    # faster for the @> containment queries used to search parses by nested
+    # fields (model, provider, token counts). They don't support key-exists
+    # (?) operators, which we don't use.
+    op.execute(
+        "CREATE INDEX idx_parse_history_json_data_gin "
+        "ON parse_history USING GIN (json_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_parse_history_usage_data_gin "
+        "ON parse_history USING GIN (usage_data jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_parse_history_usage_data_gin")
+    op.execute("DROP INDEX IF EXISTS idx_parse_history_json_data_gin")
@@ -0,0 +1,60 @@
+"""Promote hot JSONB keys into typed parse_history columns
+
+Revision ID: 004_promote_hot_jsonb_keys
+Revises: 003_jsonb_gin_indexes
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "004_promote_hot_jsonb_keys"
+down_revision: Union[str, None] = "003_jsonb_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Frequently filtered/aggregated values get real typed columns so B-tree
+    # indexes and the planner can use them without parsing JSONB per row.
+    # The JSONB payloads stay canonical during the transition; the write
+    # path populates both.
+    op.add_column("parse_history", sa.Column("model", sa.String(100), nullable=True))
+    op.add_column(
+        "parse_history", sa.Column("prompt_tokens", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "parse_history", sa.Column("completion_tokens", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "parse_history", sa.Column("total_tokens", sa.Integer(), nullable=True)
+    )
+    op.create_index("idx_parse_history_model", "parse_history", ["model"])
+
+    # Backfill from the existing JSONB payloads
+    op.execute(
+        """
+        UPDATE parse_history SET
+            model = metadata_info->>'model',
+            prompt_tokens = COALESCE(
+                (usage_data->>'prompt_tokens')::int,
+                (usage_data->>'input_tokens')::int
+            ),
+            completion_tokens = COALESCE(
+                (usage_data->>'completion_tokens')::int,
+                (usage_data->>'output_tokens')::int
+            ),
+            total_tokens = (usage_data->>'total_tokens')::int
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_parse_history_model", table_name="parse_history")
+    op.drop_column("parse_history", "total_tokens")
+    op.drop_column("parse_history", "completion_tokens")
+    op.drop_column("parse_history", "prompt_tokens")
+    op.drop_column("parse_history", "model")
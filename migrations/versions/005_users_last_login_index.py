@@ -0,0 +1,32 @@
+"""Partial index on users.last_login_at for active-user queries
+
+Revision ID: 005_users_last_login_index
+Revises: 004_promote_hot_jsonb_keys
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_users_last_login_index"
+down_revision: Union[str, None] = "004_promote_hot_jsonb_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "Recently active users" queries (last_login_at > now() - interval ...)
+    # were full table scans. The partial predicate keeps rows that never
+    # logged in out of the index, and DESC makes ORDER BY ... LIMIT N a
+    # forward scan.
+    op.execute(
+        "CREATE INDEX idx_users_last_login_active "
+        "ON users (last_login_at DESC) "
+        "WHERE last_login_at IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_users_last_login_active")
@@ -0,0 +1,30 @@
+"""Store large log columns with EXTERNAL TOAST strategy
+
+Revision ID: 006_text_storage_external
+Revises: 005_users_last_login_index
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_text_storage_external"
+down_revision: Union[str, None] = "005_users_last_login_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # EXTERNAL toasts the big log payloads out-of-line without pglz
+    # compression, so substr()-style prefix reads (the list preview) fetch
+    # only the leading TOAST chunks instead of decompressing the whole
+    # value. Only affects newly written values.
+    op.execute("ALTER TABLE parse_history ALTER COLUMN input_logs SET STORAGE EXTERNAL")
+    op.execute("ALTER TABLE parse_history ALTER COLUMN raw_text SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE parse_history ALTER COLUMN raw_text SET STORAGE EXTENDED")
+    op.execute("ALTER TABLE parse_history ALTER COLUMN input_logs SET STORAGE EXTENDED")
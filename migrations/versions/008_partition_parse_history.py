@@ -0,0 +1,158 @@
+"""Partition parse_history by month on created_at
+
+Revision ID: 008_partition_parse_history
+Revises: 007_drop_redundant_history_index
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_partition_parse_history"
+down_revision: Union[str, None] = "007_drop_redundant_history_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Explicit column list for the table copies below. The old table has
+# chunk_count/created_at before the columns appended by revision 004, while
+# the recreated tables declare them last, so a positional SELECT * would
+# shear columns.
+_COLUMNS = (
+    "id, user_id, format_type, input_logs, raw_text, json_data, usage_data, "
+    "metadata_info, model, prompt_tokens, completion_tokens, total_tokens, "
+    "chunk_count, created_at"
+)
+
+
+def _month_starts(count: int) -> list[datetime]:
+    """First days of the current month and the next `count - 1` months."""
+    now = datetime.now(UTC)
+    year, month = now.year, now.month
+    starts = []
+    for _ in range(count + 1):
+        starts.append(datetime(year, month, 1, tzinfo=UTC))
+        month += 1
+        if month > 12:
+            month = 1
+            year += 1
+    return starts
+
+
+def upgrade() -> None:
+    # parse_history is append-mostly and ever-growing; RANGE partitions by
+    # month keep working sets small and make retention a DETACH/DROP instead
+    # of a WAL-heavy bulk DELETE. The partition key must be part of the PK,
+    # hence (id, created_at).
+    op.execute("ALTER TABLE parse_history RENAME TO parse_history_old")
+    op.execute(
+        """
+        CREATE TABLE parse_history (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            format_type VARCHAR(50) NOT NULL,
+            input_logs TEXT NOT NULL,
+            raw_text TEXT,
+            json_data JSONB,
+            usage_data JSONB,
+            metadata_info JSONB,
+            model VARCHAR(100),
+            prompt_tokens INTEGER,
+            completion_tokens INTEGER,
+            total_tokens INTEGER,
+            chunk_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER TABLE parse_history ALTER COLUMN input_logs SET STORAGE EXTERNAL")
+    op.execute("ALTER TABLE parse_history ALTER COLUMN raw_text SET STORAGE EXTERNAL")
+
+    # Twelve months of partitions plus a catch-all; a scheduled job (or a
+    # later revision) is expected to pre-create further months.
+    starts = _month_starts(12)
+    for lo, hi in zip(starts[:-1], starts[1:]):
+        name = f"parse_history_{lo:%Y%m}"
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF parse_history "
+            f"FOR VALUES FROM ('{lo:%Y-%m-%d}') TO ('{hi:%Y-%m-%d}')"
+        )
+        op.execute(f"ALTER TABLE {name} SET (autovacuum_vacuum_scale_factor = 0.05)")
+    op.execute("CREATE TABLE parse_history_default PARTITION OF parse_history DEFAULT")
+    op.execute(
+        "ALTER TABLE parse_history_default "
+        "SET (autovacuum_vacuum_scale_factor = 0.05)"
+    )
+
+    op.execute(
+        f"INSERT INTO parse_history ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM parse_history_old"
+    )
+    op.execute("DROP TABLE parse_history_old")
+
+    # Recreate the indexes as partitioned indexes on the parent
+    op.execute(
+        "CREATE INDEX idx_parse_history_list_cover "
+        "ON parse_history (user_id, created_at DESC) "
+        "INCLUDE (id, format_type, chunk_count)"
+    )
+    op.execute("CREATE INDEX idx_parse_history_model ON parse_history (model)")
+    op.execute(
+        "CREATE INDEX idx_parse_history_json_data_gin "
+        "ON parse_history USING GIN (json_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_parse_history_usage_data_gin "
+        "ON parse_history USING GIN (usage_data jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE parse_history RENAME TO parse_history_part")
+    op.execute(
+        """
+        CREATE TABLE parse_history (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            format_type VARCHAR(50) NOT NULL,
+            input_logs TEXT NOT NULL,
+            raw_text TEXT,
+            json_data JSONB,
+            usage_data JSONB,
+            metadata_info JSONB,
+            model VARCHAR(100),
+            prompt_tokens INTEGER,
+            completion_tokens INTEGER,
+            total_tokens INTEGER,
+            chunk_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER TABLE parse_history ALTER COLUMN input_logs SET STORAGE EXTERNAL")
+    op.execute("ALTER TABLE parse_history ALTER COLUMN raw_text SET STORAGE EXTERNAL")
+    op.execute(
+        f"INSERT INTO parse_history ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM parse_history_part"
+    )
+    op.execute("DROP TABLE parse_history_part")
+    op.execute("ALTER TABLE parse_history SET (autovacuum_vacuum_scale_factor = 0.05)")
+    op.execute(
+        "CREATE INDEX idx_parse_history_list_cover "
+        "ON parse_history (user_id, created_at DESC) "
+        "INCLUDE (id, format_type, chunk_count)"
+    )
+    op.execute("CREATE INDEX idx_parse_history_model ON parse_history (model)")
+    op.execute(
+        "CREATE INDEX idx_parse_history_json_data_gin "
+        "ON parse_history USING GIN (json_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_parse_history_usage_data_gin "
+        "ON parse_history USING GIN (usage_data jsonb_path_ops)"
+    )
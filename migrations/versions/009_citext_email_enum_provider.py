@@ -0,0 +1,36 @@
+"""Case-insensitive email and enum provider on users
+
+Revision ID: 009_citext_email_enum_provider
+Revises: 008_partition_parse_history
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_citext_email_enum_provider"
+down_revision: Union[str, None] = "008_partition_parse_history"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CITEXT makes the unique constraint enforce case-insensitive emails
+    # in-engine, so login lookups need no lower(email) functional index.
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE CITEXT")
+    # provider only ever holds a couple of known values; a 4-byte enum beats
+    # variable-length text and keeps users tuples narrower.
+    op.execute("CREATE TYPE auth_provider AS ENUM ('google', 'github')")
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN provider "
+        "TYPE auth_provider USING provider::auth_provider"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN provider TYPE VARCHAR(50)")
+    op.execute("DROP TYPE auth_provider")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE VARCHAR(255)")
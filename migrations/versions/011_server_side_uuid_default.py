@@ -0,0 +1,33 @@
+"""Server-side UUID defaults for id columns
+
+Revision ID: 011_server_side_uuid_default
+Revises: 010_created_at_brin
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_server_side_uuid_default"
+down_revision: Union[str, None] = "010_created_at_brin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # DB-level fallback so raw SQL inserts (scripts, psql) get an id without
+    # client-side generation. The ORM keeps generating time-ordered UUIDv7
+    # ids app-side, which preserves B-tree insert locality; gen_random_uuid
+    # only fires when no id is supplied.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.execute("ALTER TABLE users ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute(
+        "ALTER TABLE parse_history ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE parse_history ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,38 @@
+"""Drop whole-column GIN indexes superseded by typed columns
+
+Revision ID: 012_drop_wholesale_gin_indexes
+Revises: 011_server_side_uuid_default
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_drop_wholesale_gin_indexes"
+down_revision: Union[str, None] = "011_server_side_uuid_default"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The queried JSONB paths (model, token counts) were promoted to typed,
+    # B-tree-indexed columns; the whole-column GIN indexes over
+    # json_data/usage_data index every key in every payload and are pure
+    # insert overhead for workloads that no longer touch them. Path-specific
+    # expression indexes can be added later if a new containment query
+    # pattern appears.
+    op.execute("DROP INDEX IF EXISTS idx_parse_history_json_data_gin")
+    op.execute("DROP INDEX IF EXISTS idx_parse_history_usage_data_gin")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX idx_parse_history_json_data_gin "
+        "ON parse_history USING GIN (json_data jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_parse_history_usage_data_gin "
+        "ON parse_history USING GIN (usage_data jsonb_path_ops)"
+    )
@@ -0,0 +1,42 @@
+"""Compress log columns with lz4 instead of skipping compression
+
+Revision ID: 013_lz4_log_compression
+Revises: 012_drop_wholesale_gin_indexes
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_lz4_log_compression"
+down_revision: Union[str, None] = "012_drop_wholesale_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # lz4 (PG14+) decompresses far faster than the legacy pglz and still
+    # compresses redundant log text well, so it beats the earlier
+    # EXTERNAL/no-compression trade: fewer TOAST pages read AND cheap
+    # decompression. Storage must go back to EXTENDED for compression to
+    # apply; existing values keep their current encoding until rewritten
+    # (VACUUM FULL / pg_repack if reclaiming space matters).
+    for col in ("input_logs", "raw_text"):
+        op.execute(
+            f"ALTER TABLE parse_history ALTER COLUMN {col} SET STORAGE EXTENDED"
+        )
+        op.execute(
+            f"ALTER TABLE parse_history ALTER COLUMN {col} SET COMPRESSION lz4"
+        )
+
+
+def downgrade() -> None:
+    for col in ("input_logs", "raw_text"):
+        op.execute(
+            f"ALTER TABLE parse_history ALTER COLUMN {col} SET COMPRESSION DEFAULT"
+        )
+        op.execute(
+            f"ALTER TABLE parse_history ALTER COLUMN {col} SET STORAGE EXTERNAL"
+        )
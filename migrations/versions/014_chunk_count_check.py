@@ -0,0 +1,37 @@
+"""Non-negative CHECK constraint on parse_history.chunk_count
+
+Revision ID: 014_chunk_count_check
+Revises: 013_lz4_log_compression
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_chunk_count_check"
+down_revision: Union[str, None] = "013_lz4_log_compression"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOT VALID skips the initial full-table scan; VALIDATE then checks
+    # existing rows with only a SHARE UPDATE EXCLUSIVE lock. Once valid, the
+    # planner can assume non-negativity in aggregates and predicates.
+    op.execute(
+        "ALTER TABLE parse_history ADD CONSTRAINT "
+        "ck_parse_history_chunk_count_nonneg CHECK (chunk_count >= 0) NOT VALID"
+    )
+    op.execute(
+        "ALTER TABLE parse_history VALIDATE CONSTRAINT "
+        "ck_parse_history_chunk_count_nonneg"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE parse_history DROP CONSTRAINT "
+        "ck_parse_history_chunk_count_nonneg"
+    )
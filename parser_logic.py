@@ -13,12 +13,34 @@ Supports multiple formats:
 Follows strict data integrity: only extracts data actually present in logs.
 """
 
+import gc
+import io
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache, partial
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Per-chunk loads is the hottest call in every parser; orjson's C parser is
+# ~2-3x stdlib json on typical LLM payloads. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers can keep catching either alias.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 
 class StreamFormat(str, Enum):
     """Supported stream formats."""
@@ -31,7 +53,7 @@ class StreamFormat(str, Enum):
     CUSTOM = "custom"                # User-defined extraction rules
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomExtractor:
     """User-defined extraction rules using JSONPath-like syntax."""
     name: str
@@ -95,7 +117,7 @@ BUILTIN_EXTRACTORS: dict[str, CustomExtractor] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing SSE delta logs."""
     raw_text: str
@@ -107,6 +129,16 @@ class ParseResult:
     detected_format: str | None = None  # Auto-detected format name
 
 
+# All format-fingerprint keys, collected in one pass so detect_format scans
+# the sample once instead of running a substring search per fingerprint.
+_FORMAT_FINGERPRINT_RE = re.compile('|'.join(re.escape(key) for key in (
+    '"content_block_delta"', '"message_start"', '"type"',
+    '"candidates"', '"content"', '"parts"',
+    '"event_type"', '"workflow_id"', '"node_id"', '"step"',
+    '"op"', '"append"', '"add"', '"path"',
+)))
+
+
 def detect_format(raw_input: str) -> StreamFormat:
     """
     Auto-detect SSE format from log content.
@@ -115,35 +147,34 @@ def detect_format(raw_input: str) -> StreamFormat:
     """
     # Sample first 5000 chars for detection
     sample = raw_input[:5000]
+    seen = set(_FORMAT_FINGERPRINT_RE.findall(sample))
 
     # Anthropic format detection
-    if '"type"' in sample and '"content_block_delta"' in sample:
-        return StreamFormat.ANTHROPIC
-    if '"type"' in sample and '"message_start"' in sample:
+    if '"type"' in seen and ('"content_block_delta"' in seen or '"message_start"' in seen):
         return StreamFormat.ANTHROPIC
 
     # Gemini format detection
-    if '"candidates"' in sample and '"content"' in sample and '"parts"' in sample:
+    if '"candidates"' in seen and '"content"' in seen and '"parts"' in seen:
         return StreamFormat.GEMINI
 
     # MAS Response format detection (multi-agent)
-    if '"event_type"' in sample and '"workflow_id"' in sample:
+    if '"event_type"' in seen and '"workflow_id"' in seen:
         return StreamFormat.MAS_RESPONSE
-    if '"node_id"' in sample and '"step"' in sample:
+    if '"node_id"' in seen and '"step"' in seen:
         return StreamFormat.MAS_RESPONSE
 
     # Playground format detection (JSON Patch)
-    if '"op"' in sample and ('"append"' in sample or '"add"' in sample) and '"path"' in sample:
+    if '"op"' in seen and ('"append"' in seen or '"add"' in seen) and '"path"' in seen:
         return StreamFormat.PLAYGROUND
 
     # OpenAI/Orchestrator format detection (default fallback)
-    if '"choices"' in sample and '"delta"' in sample:
-        return StreamFormat.ORCHESTRATOR
-
-    # Default to orchestrator if nothing matches
     return StreamFormat.ORCHESTRATOR
 
 
+# Input size above which parse_sse_logs pauses the cyclic GC for the parse
+_GC_PAUSE_THRESHOLD = 1_000_000
+
+
 def parse_sse_logs(
     raw_input: str,
     format_type: StreamFormat = StreamFormat.ORCHESTRATOR,
@@ -166,26 +197,118 @@ def parse_sse_logs(
         format_type = detect_format(raw_input)
         detected = format_type.value
 
-    # Route to appropriate parser
-    if format_type == StreamFormat.PLAYGROUND:
-        result = parse_playground_logs(raw_input)
-    elif format_type == StreamFormat.MAS_RESPONSE:
-        result = parse_mas_response_logs(raw_input)
-    elif format_type == StreamFormat.ANTHROPIC:
-        result = parse_anthropic_logs(raw_input)
-    elif format_type == StreamFormat.GEMINI:
-        result = parse_gemini_logs(raw_input)
-    elif format_type == StreamFormat.CUSTOM and custom_extractor:
-        if isinstance(custom_extractor, dict):
-            custom_extractor = CustomExtractor.from_dict(custom_extractor)
-        result = parse_with_custom_extractor(raw_input, custom_extractor)
-    else:
-        result = parse_orchestrator_logs(raw_input)
+    # Large parses allocate huge numbers of short-lived chunk dicts that all
+    # die together; pausing the cyclic collector for the duration avoids
+    # pointless generational scans mid-parse. Small logs keep incremental GC.
+    pause_gc = len(raw_input) > _GC_PAUSE_THRESHOLD and gc.isenabled()
+    if pause_gc:
+        gc.disable()
+
+    try:
+        # Route to appropriate parser
+        if format_type == StreamFormat.PLAYGROUND:
+            result = parse_playground_logs(raw_input)
+        elif format_type == StreamFormat.MAS_RESPONSE:
+            result = parse_mas_response_logs(raw_input)
+        elif format_type == StreamFormat.ANTHROPIC:
+            result = parse_anthropic_logs(raw_input)
+        elif format_type == StreamFormat.GEMINI:
+            result = parse_gemini_logs(raw_input)
+        elif format_type == StreamFormat.CUSTOM and custom_extractor:
+            if isinstance(custom_extractor, dict):
+                custom_extractor = CustomExtractor.from_dict(custom_extractor)
+            result = parse_with_custom_extractor(raw_input, custom_extractor)
+        else:
+            result = parse_orchestrator_logs(raw_input)
+    finally:
+        if pause_gc:
+            gc.enable()
+            gc.collect()
 
     result.detected_format = detected
     return result
 
 
+def parse_sse_logs_batch(
+    raw_inputs: list[str],
+    format_type: StreamFormat = StreamFormat.ORCHESTRATOR,
+    custom_extractor: CustomExtractor | dict | None = None,
+    max_workers: int | None = None,
+) -> list[ParseResult]:
+    """
+    Parse many independent SSE logs in parallel across processes.
+
+    Each log is parsed by `parse_sse_logs` in a worker process, so the
+    CPU-bound JSON decoding is not serialized behind the GIL. Results are
+    returned in input order.
+
+    Args:
+        raw_inputs: Raw SSE log texts, one per stream
+        format_type: Stream format to parse (or AUTO for detection)
+        custom_extractor: Custom extraction rules (for CUSTOM format)
+        max_workers: Worker process count (defaults to the CPU count)
+
+    Returns:
+        List of ParseResult, aligned with raw_inputs
+    """
+    if not raw_inputs:
+        return []
+
+    if isinstance(custom_extractor, dict):
+        custom_extractor = CustomExtractor.from_dict(custom_extractor)
+
+    worker = partial(
+        parse_sse_logs,
+        format_type=format_type,
+        custom_extractor=custom_extractor,
+    )
+    workers = max_workers or os.cpu_count() or 1
+    # Batch submissions so per-item IPC overhead is amortized while keeping
+    # enough slices per worker to balance uneven log sizes.
+    chunksize = max(1, len(raw_inputs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, raw_inputs, chunksize=chunksize))
+
+
+def _split_path(path: str) -> list[str]:
+    """Split a path on '.' while leaving dots inside [...] untouched."""
+    parts: list[str] = []
+    last = 0
+    depth = 0
+    for i, char in enumerate(path):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == '.' and depth == 0:
+            parts.append(path[last:i])
+            last = i + 1
+    parts.append(path[last:])
+    return parts
+
+
+@lru_cache(maxsize=512)
+def _compile_path(path: str) -> tuple[tuple[str, int | str | None], ...]:
+    """
+    Parse a JSONPath-like string into (key, index) steps, once per path.
+
+    Each step is ("key", None) for plain key access, ("key", 3) for an
+    array index, or ("key", "*") for a wildcard. Extractor paths are fixed
+    strings, so caching the compiled form keeps regex work out of the
+    per-chunk loop.
+    """
+    steps: list[tuple[str, int | str | None]] = []
+    for part in _split_path(path):
+        match = re.match(r'(\w+)\[(\*|\d+)\]', part)
+        if match:
+            key, index = match.groups()
+            steps.append((key, index if index == '*' else int(index)))
+        else:
+            steps.append((part, None))
+    return tuple(steps)
+
+
 def get_nested_value(obj: Any, path: str) -> Any:
     """
     Get nested value from object using JSONPath-like syntax.
@@ -205,17 +328,19 @@ def get_nested_value(obj: Any, path: str) -> Any:
     if not path or obj is None:
         return None
 
-    parts = re.split(r'\.(?![^\[]*\])', path)
     current = obj
 
-    for part in parts:
+    for key, index in _compile_path(path):
         if current is None:
             return None
 
-        # Handle array access
-        match = re.match(r'(\w+)\[(\*|\d+)\]', part)
-        if match:
-            key, index = match.groups()
+        if index is None:
+            # Simple key access
+            if isinstance(current, dict):
+                current = current.get(key)
+            else:
+                return None
+        else:
             if key:
                 current = current.get(key) if isinstance(current, dict) else None
             if current is None:
@@ -225,61 +350,42 @@ def get_nested_value(obj: Any, path: str) -> Any:
                 if isinstance(current, list):
                     return current
                 return None
-            else:
-                idx = int(index)
-                if isinstance(current, list) and 0 <= idx < len(current):
-                    current = current[idx]
-                else:
-                    return None
-        else:
-            # Simple key access
-            if isinstance(current, dict):
-                current = current.get(part)
+            elif isinstance(current, list) and 0 <= index < len(current):
+                current = current[index]
             else:
                 return None
 
     return current
 
 
-def extract_sse_chunks(raw_input: str) -> list[dict]:
+# Matches one JSON payload per SSE line: an optional "data:" prefix followed
+# by an object literal. Blank lines, "event:" lines and meta tokens such as
+# [DONE]/start/end never begin with '{', so a single finditer sweep replaces
+# the per-line strip/startswith/set-membership triage. The capture excludes
+# '\r' so CRLF logs yield clean payloads without stripping every line.
+_SSE_DATA_RE = re.compile(r'^[ \t]*(?:data:[ \t]*)?(\{[^\r\n]*)', re.MULTILINE)
+
+
+def extract_sse_chunks(raw_input: str, errors: list[str] | None = None) -> list[dict]:
     """
     Extract JSON chunks from SSE log text.
 
     Args:
         raw_input: Raw SSE log text
+        errors: Optional list that collects parse-error messages;
+            malformed payloads are skipped silently when omitted
 
     Returns:
         List of parsed JSON objects
     """
-    lines = raw_input.strip().split('\n')
     chunks = []
 
-    meta_messages = {
-        '[DONE]', 'start', 'end', 'reserved',
-        'data: [DONE]', 'data: start', 'data: end', 'data: reserved',
-        'data:[DONE]', 'data:start', 'data:end', 'data:reserved',
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
-
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
-
-        if not json_str or json_str in meta_messages:
-            continue
-
-        if not json_str.startswith('{'):
-            continue
-
+    for match in _SSE_DATA_RE.finditer(raw_input):
         try:
-            chunk = json.loads(json_str)
-            chunks.append(chunk)
-        except json.JSONDecodeError:
+            chunks.append(_json_loads(match.group(1)))
+        except _JSONDecodeError as e:
+            if errors is not None:
+                errors.append(f"JSON parse error: {str(e)[:50]}")
             continue
 
     return chunks
@@ -296,52 +402,58 @@ def parse_with_custom_extractor(raw_input: str, extractor: CustomExtractor) -> P
     Returns:
         ParseResult with extracted content
     """
-    chunks = extract_sse_chunks(raw_input)
-    contents: list[str] = []
+    buf = io.StringIO()
     usage: dict | None = None
     metadata: dict | None = None
     errors: list[str] = []
     chunk_count = 0
+    chunks = extract_sse_chunks(raw_input, errors)
+
+    # Bind everything the per-chunk loop touches to locals once: extractor
+    # attributes, the filter items, the nested-value lookup and the buffer
+    # write. Saves an attribute/global lookup per access inside the loop.
+    filter_items = tuple(extractor.event_filter.items()) if extractor.event_filter else None
+    content_paths = extractor.content_paths
+    usage_path = extractor.usage_path
+    metadata_paths = extractor.metadata_paths
+    get_value = get_nested_value
+    write = buf.write
 
     for chunk in chunks:
         # Apply event filter if specified
-        if extractor.event_filter:
-            matches = True
-            for key, value in extractor.event_filter.items():
-                if chunk.get(key) != value:
-                    matches = False
-                    break
-            if not matches:
+        if filter_items is not None:
+            chunk_get = chunk.get
+            if any(chunk_get(key) != value for key, value in filter_items):
                 continue
 
         chunk_count += 1
 
         # Extract content using all content paths
-        for path in extractor.content_paths:
-            value = get_nested_value(chunk, path)
+        for path in content_paths:
+            value = get_value(chunk, path)
             if value is not None:
                 if isinstance(value, list):
                     for v in value:
                         if v is not None:
-                            contents.append(str(v))
+                            write(str(v))
                 else:
-                    contents.append(str(value))
+                    write(str(value))
 
         # Extract usage
-        if extractor.usage_path and usage is None:
-            usage = get_nested_value(chunk, extractor.usage_path)
+        if usage_path and usage is None:
+            usage = get_value(chunk, usage_path)
 
         # Extract metadata from first matching chunk
-        if metadata is None and extractor.metadata_paths:
+        if metadata is None and metadata_paths:
             metadata = {}
-            for meta_key, meta_path in extractor.metadata_paths.items():
-                value = get_nested_value(chunk, meta_path)
+            for meta_key, meta_path in metadata_paths.items():
+                value = get_value(chunk, meta_path)
                 if value is not None:
                     metadata[meta_key] = value
             if not metadata:
                 metadata = None
 
-    full_text = ''.join(contents)
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -360,70 +472,49 @@ def parse_orchestrator_logs(raw_input: str) -> ParseResult:
 
     Extracts data from choices[0].delta.content.
     """
-    lines = raw_input.strip().split('\n')
-    contents: list[str] = []
+    buf = io.StringIO()
     usage: dict | None = None
     metadata: dict | None = None
     errors: list[str] = []
     chunk_count = 0
 
     metadata_fields = ('id', 'created', 'model', 'object', 'service_tier', 'system_fingerprint')
-    meta_messages = {
-        '[DONE]', 'start', 'end', 'reserved',
-        'data: [DONE]', 'data: start', 'data: end', 'data: reserved',
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
-
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
+    chunks = extract_sse_chunks(raw_input, errors)
+
+    # Metadata comes from the first chunk only; extracting it up front keeps
+    # the per-chunk loop free of the metadata-is-None branch.
+    if chunks:
+        metadata = {}
+        for fld in metadata_fields:
+            if fld in chunks[0]:
+                value = chunks[0][fld]
+                if fld == 'created' and isinstance(value, int):
+                    metadata[fld] = value
+                    metadata['created_formatted'] = datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+                else:
+                    metadata[fld] = value
 
-        if not json_str or json_str in meta_messages or not json_str.startswith('{'):
-            continue
+    for chunk in chunks:
+        chunk_count += 1
 
-        try:
-            chunk = json.loads(json_str)
-            chunk_count += 1
-
-            if metadata is None:
-                metadata = {}
-                for fld in metadata_fields:
-                    if fld in chunk:
-                        value = chunk[fld]
-                        if fld == 'created' and isinstance(value, int):
-                            from datetime import datetime
-                            metadata[fld] = value
-                            metadata['created_formatted'] = datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M:%S')
-                        else:
-                            metadata[fld] = value
-
-            choices = chunk.get('choices', [])
-            if choices and len(choices) > 0:
-                delta = choices[0].get('delta', {})
-                content = delta.get('content')
-                if content is not None:
-                    contents.append(content)
+        choices = chunk.get('choices')
+        if choices:
+            delta = choices[0].get('delta') or {}
+            content = delta.get('content')
+            if content is not None:
+                buf.write(content)
 
-                tool_calls = delta.get('tool_calls', [])
+            tool_calls = delta.get('tool_calls')
+            if tool_calls:
                 for tc in tool_calls:
-                    func = tc.get('function', {})
-                    args = func.get('arguments')
+                    args = (tc.get('function') or {}).get('arguments')
                     if args is not None:
-                        contents.append(args)
+                        buf.write(args)
 
-            if 'usage' in chunk and chunk['usage'] is not None:
-                usage = chunk['usage']
+        if (chunk_usage := chunk.get('usage')) is not None:
+            usage = chunk_usage
 
-        except json.JSONDecodeError as e:
-            errors.append(f"JSON parse error: {str(e)[:50]}")
-            continue
-
-    full_text = ''.join(contents)
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -449,39 +540,24 @@ def parse_anthropic_logs(raw_input: str) -> ParseResult:
     - message_delta: Message completion with stop_reason and usage
     - message_stop: End of message
     """
-    lines = raw_input.strip().split('\n')
-    contents: list[str] = []
+    buf = io.StringIO()
     usage: dict | None = None
     metadata: dict | None = None
     errors: list[str] = []
     chunk_count = 0
 
-    meta_messages = {
-        '[DONE]', 'start', 'end', 'reserved',
-        'data: [DONE]', 'data: start', 'data: end', 'data: reserved',
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
-
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
-
-        if not json_str or json_str in meta_messages or not json_str.startswith('{'):
-            continue
-
-        try:
-            chunk = json.loads(json_str)
-            event_type = chunk.get('type')
+    for chunk in extract_sse_chunks(raw_input, errors):
+        # Intern the event type so the dispatch comparisons below hit the
+        # pointer-equality fast path instead of comparing characters.
+        event_type = chunk.get('type')
+        if type(event_type) is str:
+            event_type = sys.intern(event_type)
 
+        match event_type:
             # Extract metadata from message_start
-            if event_type == 'message_start':
+            case 'message_start':
                 chunk_count += 1
-                message = chunk.get('message', {})
+                message = chunk.get('message') or {}
                 if metadata is None:
                     metadata = {
                         'id': message.get('id'),
@@ -493,52 +569,45 @@ def parse_anthropic_logs(raw_input: str) -> ParseResult:
                     metadata = {k: v for k, v in metadata.items() if v is not None}
 
                 # Extract input usage from message_start
-                msg_usage = message.get('usage')
-                if msg_usage:
+                if (msg_usage := message.get('usage')):
                     usage = usage or {}
                     usage['input_tokens'] = msg_usage.get('input_tokens')
 
             # Extract content from content_block_delta
-            elif event_type == 'content_block_delta':
+            case 'content_block_delta':
                 chunk_count += 1
-                delta = chunk.get('delta', {})
+                delta = chunk.get('delta') or {}
                 delta_type = delta.get('type')
 
                 if delta_type == 'text_delta':
                     text = delta.get('text')
                     if text is not None:
-                        contents.append(text)
+                        buf.write(text)
                 elif delta_type == 'input_json_delta':
                     # Tool use input
                     partial_json = delta.get('partial_json')
                     if partial_json is not None:
-                        contents.append(partial_json)
+                        buf.write(partial_json)
 
             # Extract output usage from message_delta
-            elif event_type == 'message_delta':
+            case 'message_delta':
                 chunk_count += 1
-                delta_usage = chunk.get('usage')
-                if delta_usage:
+                if (delta_usage := chunk.get('usage')):
                     usage = usage or {}
                     usage['output_tokens'] = delta_usage.get('output_tokens')
                     if usage.get('input_tokens') and usage.get('output_tokens'):
                         usage['total_tokens'] = usage['input_tokens'] + usage['output_tokens']
 
                 # Extract stop reason
-                delta = chunk.get('delta', {})
-                stop_reason = delta.get('stop_reason')
-                if stop_reason and metadata:
+                delta = chunk.get('delta') or {}
+                if (stop_reason := delta.get('stop_reason')) and metadata:
                     metadata['stop_reason'] = stop_reason
 
             # Count other event types
-            elif event_type in ('content_block_start', 'content_block_stop', 'message_stop'):
+            case 'content_block_start' | 'content_block_stop' | 'message_stop':
                 chunk_count += 1
 
-        except json.JSONDecodeError as e:
-            errors.append(f"JSON parse error: {str(e)[:50]}")
-            continue
-
-    full_text = ''.join(contents)
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -558,84 +627,81 @@ def parse_gemini_logs(raw_input: str) -> ParseResult:
     Extracts content from candidates[0].content.parts[0].text.
     Note: Gemini returns cumulative text, not deltas, so we need to handle this.
     """
-    lines = raw_input.strip().split('\n')
-    contents: list[str] = []
+    buf = io.StringIO()
     usage: dict | None = None
     metadata: dict | None = None
     errors: list[str] = []
     chunk_count = 0
     last_text = ""
+    last_len = 0
+    chunks_since_check = 0
+    chunks = extract_sse_chunks(raw_input, errors)
 
-    meta_messages = {
-        '[DONE]', 'start', 'end', 'reserved',
-        'data: [DONE]', 'data: start', 'data: end', 'data: reserved',
-    }
-
-    for line in lines:
-        line = line.strip()
+    # Extract metadata from the first chunk up front
+    if chunks:
+        metadata = {}
+        if 'modelVersion' in chunks[0]:
+            metadata['model'] = chunks[0]['modelVersion']
 
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
-
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
-
-        if not json_str or json_str in meta_messages or not json_str.startswith('{'):
-            continue
-
-        try:
-            chunk = json.loads(json_str)
-            chunk_count += 1
-
-            # Extract metadata
-            if metadata is None:
-                metadata = {}
-                if 'modelVersion' in chunk:
-                    metadata['model'] = chunk['modelVersion']
-
-            # Extract content from candidates
-            candidates = chunk.get('candidates', [])
-            if candidates and len(candidates) > 0:
-                candidate = candidates[0]
-                content = candidate.get('content', {})
-                parts = content.get('parts', [])
-
-                for part in parts:
-                    text = part.get('text')
-                    if text is not None:
-                        # Gemini returns cumulative text, extract delta
-                        if text.startswith(last_text):
-                            delta = text[len(last_text):]
-                            if delta:
-                                contents.append(delta)
-                            last_text = text
-                        else:
-                            # First chunk or non-cumulative
-                            contents.append(text)
-                            last_text = text
-
-                # Extract finish reason
-                finish_reason = candidate.get('finishReason')
-                if finish_reason and metadata:
-                    metadata['finish_reason'] = finish_reason
-
-            # Extract usage metadata
-            usage_meta = chunk.get('usageMetadata')
-            if usage_meta:
-                usage = {
-                    'prompt_tokens': usage_meta.get('promptTokenCount'),
-                    'completion_tokens': usage_meta.get('candidatesTokenCount'),
-                    'total_tokens': usage_meta.get('totalTokenCount'),
-                }
-                # Remove None values
-                usage = {k: v for k, v in usage.items() if v is not None}
-
-        except json.JSONDecodeError as e:
-            errors.append(f"JSON parse error: {str(e)[:50]}")
-            continue
+    for chunk in chunks:
+        chunk_count += 1
 
-    full_text = ''.join(contents)
+        # Extract content from candidates
+        candidates = chunk.get('candidates')
+        if candidates:
+            candidate = candidates[0]
+            parts = (candidate.get('content') or {}).get('parts') or ()
+
+            for part in parts:
+                text = part.get('text')
+                if text is not None:
+                    # Gemini returns cumulative text, extract delta. A full
+                    # startswith check per chunk is O(len(last_text)) and goes
+                    # quadratic on long streams, so trust the length counter
+                    # when the text strictly grew and a small boundary window
+                    # still matches, re-verifying the whole prefix every 32
+                    # chunks. Equal or shrinking texts always take the full
+                    # comparison below, so non-cumulative chunks of the same
+                    # length are never mistaken for an empty delta.
+                    window = last_len - 8 if last_len >= 8 else 0
+                    cumulative = (
+                        len(text) > last_len
+                        and text[window:last_len] == last_text[window:]
+                    )
+                    if cumulative:
+                        chunks_since_check += 1
+                        if chunks_since_check >= 32:
+                            chunks_since_check = 0
+                            cumulative = text.startswith(last_text)
+                    if cumulative:
+                        delta = text[last_len:]
+                        if delta:
+                            buf.write(delta)
+                    elif text.startswith(last_text):
+                        delta = text[len(last_text):]
+                        if delta:
+                            buf.write(delta)
+                    else:
+                        # First chunk or non-cumulative
+                        buf.write(text)
+                    last_text = text
+                    last_len = len(text)
+
+            # Extract finish reason
+            if (finish_reason := candidate.get('finishReason')) and metadata:
+                metadata['finish_reason'] = finish_reason
+
+        # Extract usage metadata
+        if (usage_meta := chunk.get('usageMetadata')):
+            usage = {
+                'prompt_tokens': usage_meta.get('promptTokenCount'),
+                'completion_tokens': usage_meta.get('candidatesTokenCount'),
+                'total_tokens': usage_meta.get('totalTokenCount'),
+            }
+            # Remove None values
+            usage = {k: v for k, v in usage.items() if v is not None}
+
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -652,55 +718,32 @@ def parse_playground_logs(raw_input: str) -> ParseResult:
     """
     Parse Playground SSE logs using JSON Patch format.
     """
-    lines = raw_input.strip().split('\n')
-    contents: list[str] = []
+    buf = io.StringIO()
     errors: list[str] = []
     chunk_count = 0
 
-    meta_messages = {
-        'reserved', 'start', 'end',
-        'data:reserved', 'data:start', 'data:end',
-        'data: reserved', 'data: start', 'data: end',
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
+    for chunk in extract_sse_chunks(raw_input, errors):
+        chunk_count += 1
 
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
+        op = chunk.get('op')
+        if type(op) is str:
+            op = sys.intern(op)
+        path = chunk.get('path', '')
+        value = chunk.get('value')
 
-        if not json_str or json_str in meta_messages or not json_str.startswith('{'):
-            continue
+        if op == 'add':
+            if isinstance(value, dict) and 'content' in value:
+                content = value.get('content')
+                if content is not None:
+                    buf.write(str(content))
+            elif path.endswith('/content') and value is not None:
+                buf.write(str(value))
 
-        try:
-            chunk = json.loads(json_str)
-            chunk_count += 1
-
-            op = chunk.get('op')
-            path = chunk.get('path', '')
-            value = chunk.get('value')
-
-            if op == 'add':
-                if isinstance(value, dict) and 'content' in value:
-                    content = value.get('content')
-                    if content is not None:
-                        contents.append(str(content))
-                elif path.endswith('/content') and value is not None:
-                    contents.append(str(value))
-
-            elif op == 'append':
-                if path.endswith('/content') and value is not None:
-                    contents.append(str(value))
-
-        except json.JSONDecodeError as e:
-            errors.append(f"JSON parse error: {str(e)[:50]}")
-            continue
+        elif op == 'append':
+            if path.endswith('/content') and value is not None:
+                buf.write(str(value))
 
-    full_text = ''.join(contents)
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -723,8 +766,7 @@ def parse_mas_response_logs(raw_input: str) -> ParseResult:
     - Content is in content[].text where event_type is "stream"
     - Supports multiple content types: text, tool_use, etc.
     """
-    lines = raw_input.strip().split('\n')
-    contents: list[str] = []
+    buf = io.StringIO()
     metadata: dict | None = None
     usage: dict | None = None
     errors: list[str] = []
@@ -733,96 +775,74 @@ def parse_mas_response_logs(raw_input: str) -> ParseResult:
     # Track agents/nodes for multi-agent metadata
     agents_seen: dict[str, dict] = {}
 
-    meta_messages = {
-        'reserved', 'start', 'end', '[DONE]',
-        'data:reserved', 'data:start', 'data:end', 'data:[DONE]',
-        'data: reserved', 'data: start', 'data: end', 'data: [DONE]',
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        if not line or line.startswith('event:') or line in meta_messages or line == 'data:':
-            continue
-
-        json_str = line
-        if line.startswith('data:'):
-            json_str = line[5:].strip()
-
-        if not json_str or json_str in meta_messages or not json_str.startswith('{'):
-            continue
-
-        try:
-            chunk = json.loads(json_str)
-
-            # Skip connection events
-            if 'status' in chunk and chunk.get('status') == 'connected':
-                continue
+    # Skip connection events before the loop so metadata can be peeled from
+    # the first real chunk and the loop drops the metadata-is-None branch.
+    chunks = [
+        chunk for chunk in extract_sse_chunks(raw_input, errors)
+        if chunk.get('status') != 'connected'
+    ]
 
-            chunk_count += 1
-            event_type = chunk.get('event_type')
-
-            # Track workflow metadata
-            workflow_id = chunk.get('workflow_id')
-            node_id = chunk.get('node_id')
-            step = chunk.get('step')
-
-            # Initialize metadata on first chunk
-            if metadata is None:
-                metadata = {}
-                if workflow_id:
-                    metadata['workflow_id'] = workflow_id
-                if 'timestamp' in chunk:
-                    metadata['started_at'] = chunk['timestamp']
-
-            # Track agent/node information
-            if node_id and node_id not in agents_seen:
-                agents_seen[node_id] = {
-                    'node_id': node_id,
-                    'first_step': step,
-                }
+    if chunks:
+        metadata = {}
+        if chunks[0].get('workflow_id'):
+            metadata['workflow_id'] = chunks[0]['workflow_id']
+        if 'timestamp' in chunks[0]:
+            metadata['started_at'] = chunks[0]['timestamp']
 
+    for chunk in chunks:
+        chunk_count += 1
+        event_type = chunk.get('event_type')
+        if type(event_type) is str:
+            event_type = sys.intern(event_type)
+
+        # Track workflow metadata
+        node_id = chunk.get('node_id')
+        step = chunk.get('step')
+
+        # Track agent/node information
+        if node_id and node_id not in agents_seen:
+            agents_seen[node_id] = {
+                'node_id': node_id,
+                'first_step': step,
+            }
+
+        match event_type:
             # Extract text content from stream events
-            if event_type == 'stream':
-                content_list = chunk.get('content', [])
+            case 'stream':
+                content_list = chunk.get('content') or ()
                 for content_item in content_list:
                     if isinstance(content_item, dict):
                         content_type = content_item.get('type')
                         if content_type == 'text':
                             text = content_item.get('text')
                             if text is not None:
-                                contents.append(text)
+                                buf.write(text)
                         elif content_type == 'tool_use':
                             # Handle tool use content
-                            tool_input = content_item.get('input')
-                            if tool_input:
-                                contents.append(json.dumps(tool_input))
+                            if (tool_input := content_item.get('input')):
+                                buf.write(json.dumps(tool_input))
 
             # Handle workflow completion
-            elif event_type == 'workflow_complete':
+            case 'workflow_complete':
                 if metadata:
                     metadata['completed_at'] = chunk.get('timestamp')
                     metadata['total_steps'] = step
 
             # Handle node completion (per-agent)
-            elif event_type == 'node_complete':
+            case 'node_complete':
                 if node_id and node_id in agents_seen:
                     agents_seen[node_id]['last_step'] = step
 
-            # Extract usage if available
-            if 'usage' in chunk and chunk['usage']:
-                usage = chunk['usage']
-
-        except json.JSONDecodeError as e:
-            errors.append(f"JSON parse error: {str(e)[:50]}")
-            continue
+        # Extract usage if available
+        if (chunk_usage := chunk.get('usage')):
+            usage = chunk_usage
 
     # Add agents info to metadata
     if metadata and agents_seen:
         metadata['agents'] = list(agents_seen.values())
         metadata['agent_count'] = len(agents_seen)
 
-    full_text = ''.join(contents)
+    full_text = buf.getvalue()
     json_data = extract_json_from_text(full_text)
 
     return ParseResult(
@@ -835,6 +855,11 @@ def parse_mas_response_logs(raw_input: str) -> ParseResult:
     )
 
 
+# Shared decoder; raw_decode tolerates trailing text after the object, which
+# replaces the old hand-rolled brace/escape scanner with the C accelerator.
+_DECODER = json.JSONDecoder()
+
+
 def extract_json_from_text(text: str) -> dict | None:
     """
     Extract JSON object from text if present.
@@ -843,53 +868,21 @@ def extract_json_from_text(text: str) -> dict | None:
         return None
 
     start_idx = text.find('{')
-    if start_idx == -1:
+    if start_idx == -1 or '}' not in text:
         return None
 
-    depth = 0
-    end_idx = -1
-    in_string = False
-    escape_next = False
-
-    for i in range(start_idx, len(text)):
-        char = text[i]
-
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == '{':
-            depth += 1
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                end_idx = i
-                break
-
-    if end_idx == -1:
-        return None
-
-    json_str = text[start_idx:end_idx + 1]
-
     try:
-        return json.loads(json_str)
+        obj, _ = _DECODER.raw_decode(text[start_idx:])
     except json.JSONDecodeError:
         return None
 
+    return obj if isinstance(obj, dict) else None
+
 
 def format_json(data: Any, indent: int = 2) -> str:
     """Format JSON data with indentation for display."""
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(data, indent=indent, ensure_ascii=False)
 
 